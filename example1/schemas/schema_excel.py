@@ -1,18 +1,11 @@
-schema = {
-    "type": "function",
-    "function": {
-        "name": "extract_information_excel",
-        "description": "Analiza archivo Excel",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": "Archivo Excel a analizar",
-                    "default": "datos_negocio_simulado.xlsx"
-                }
-            },
-            "required": ["file_path"]
-        }
-    }
-}
\ No newline at end of file
+from src.deepseek_agent import SchemaGenerator
+from example1.tools.extract_information_excel import extract_information_excel
+
+# El schema se genera desde la firma de la función: tipos y default
+# salen de los type hints, sin literal duplicado que mantener a mano.
+# file_path tiene default, así que no se marca como requerido.
+schema = SchemaGenerator.from_function(
+    extract_information_excel,
+    "Analiza archivo Excel",
+    {"file_path": "Archivo Excel a analizar"}
+)
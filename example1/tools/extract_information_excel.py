@@ -1,13 +1,90 @@
-import pandas as pd
-import json
+import os
+
+# pandas/orjson/python-calamine se importan de forma perezosa dentro de
+# las funciones: cargar pandas cuesta cientos de ms y el LLM puede no
+# invocar esta herramienta en un turno dado. Tras la primera llamada el
+# import sale de sys.modules y cuesta microsegundos.
+
+# Motor de lectura resuelto una sola vez en el primer uso
+_EXCEL_ENGINE = None
+_ENGINE_RESOLVED = False
+
+def _get_engine():
+    """Elige el motor de lectura: calamine (Rust) si está instalado"""
+    global _EXCEL_ENGINE, _ENGINE_RESOLVED
+    if not _ENGINE_RESOLVED:
+        try:
+            import python_calamine  # noqa: F401
+            _EXCEL_ENGINE = "calamine"
+        except ImportError:
+            _EXCEL_ENGINE = None
+        _ENGINE_RESOLVED = True
+    return _EXCEL_ENGINE
+
+def _count_rows(file_path: str) -> int:
+    """Cuenta las filas de datos sin cargar la hoja completa
+
+    Para .xlsx/.xlsm usa los metadatos de openpyxl en modo read_only;
+    para otros formatos, o si openpyxl no está instalado, cae a la
+    lectura completa de pandas.
+    """
+    if file_path.lower().endswith((".xlsx", ".xlsm")):
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            pass
+        else:
+            wb = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                return max((wb.active.max_row or 1) - 1, 0)
+            finally:
+                wb.close()
+    import pandas as pd
+    return len(pd.read_excel(file_path, engine=_get_engine()))
+
+def _dumps(info) -> str:
+    """Serializa el resultado (orjson si está disponible, json si no)"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(info, indent=2, default=str)
+    return orjson.dumps(
+        info,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        default=str
+    ).decode()
+
+# Caché de resultados por archivo: se invalida sola cuando el archivo
+# cambia (mtime o tamaño distintos), así las llamadas repetidas del
+# agente no vuelven a parsear el Excel
+_EXCEL_CACHE = {}
+
 def extract_information_excel(file_path: str = "datos_negocio_simulado.xlsx") -> str:
     try:
-        df = pd.read_excel(file_path)
+        st = os.stat(file_path)
+        cache_key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        cached = _EXCEL_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+    except OSError:
+        # Archivo inexistente: dejar que read_excel reporte el error
+        cache_key = None
+
+    try:
+        import pandas as pd
+
+        # Solo se necesitan el encabezado y 2 filas de muestra: leerlas
+        # con nrows evita materializar la hoja completa
+        df = pd.read_excel(file_path, engine=_get_engine(), nrows=2)
         info = {
-            "filas": len(df),
+            "filas": _count_rows(file_path),
             "columnas": list(df.columns),
-            "muestra": df.head(2).to_dict('records')
+            "muestra": df.to_dict('records')
         }
-        return json.dumps(info, indent=2, default=str)
+        result = _dumps(info)
+        if cache_key is not None:
+            _EXCEL_CACHE[cache_key] = result
+        return result
     except Exception as e:
-        return f"Error: {str(e)}"
\ No newline at end of file
+        return f"Error: {str(e)}"
@@ -1,11 +1,12 @@
 from .agent import DeepSeekAgent
-from .utils.schema import ParameterConfig, SchemaGenerator, SchemaValidator
+from .utils.schema import ParameterConfig, CompiledSchema, SchemaGenerator, SchemaValidator
 
 __version__ = "0.1.0"
 
 __all__ = [
     "DeepSeekAgent",
     "ParameterConfig",
+    "CompiledSchema",
     "SchemaGenerator",
     "SchemaValidator"
 ]
\ No newline at end of file
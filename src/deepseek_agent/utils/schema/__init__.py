@@ -1,7 +1,8 @@
 # Importar y exportar las clases principales para facilitar el acceso
 from .parameter_config import ParameterConfig
+from .compiled_schema import CompiledSchema
 from .generator import SchemaGenerator
 from .validator import SchemaValidator
 
 # Para mantener la compatibilidad con código existente
-__all__ = ['ParameterConfig', 'SchemaGenerator', 'SchemaValidator']
\ No newline at end of file
+__all__ = ['ParameterConfig', 'CompiledSchema', 'SchemaGenerator', 'SchemaValidator']
\ No newline at end of file
@@ -0,0 +1,71 @@
+from typing import Dict, Any, Optional, Tuple
+
+class CompiledSchema:
+    """Representación compacta de un schema de función
+
+    En lugar de dicts anidados guarda los parámetros en tuplas paralelas
+    (names/types/descriptions/extras) más una máscara de bits para los
+    requeridos: muchas menos asignaciones y mejor localidad cuando un
+    agente registra decenas de herramientas. to_dict() materializa el
+    schema JSON solo cuando hay que enviarlo al LLM.
+    """
+    __slots__ = (
+        "function_name",
+        "description",
+        "names",
+        "types",
+        "descriptions",
+        "extras",
+        "required_mask"
+    )
+
+    def __init__(
+        self,
+        function_name: str,
+        description: str,
+        names: Tuple[str, ...],
+        types: Tuple[str, ...],
+        descriptions: Tuple[str, ...],
+        extras: Tuple[Optional[Tuple[Tuple[str, Any], ...]], ...],
+        required_mask: int
+    ):
+        self.function_name = function_name
+        self.description = description
+        self.names = names
+        self.types = types
+        self.descriptions = descriptions
+        self.extras = extras
+        self.required_mask = required_mask
+
+    def is_required(self, index: int) -> bool:
+        """Indica si el parámetro en la posición index es requerido"""
+        return bool(self.required_mask >> index & 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materializa el schema JSON anidado a partir de las tuplas"""
+        properties = {}
+        required = []
+        for i, name in enumerate(self.names):
+            prop = {
+                "type": self.types[i],
+                "description": self.descriptions[i]
+            }
+            extra = self.extras[i]
+            if extra:
+                prop.update(extra)
+            properties[name] = prop
+            if self.required_mask >> i & 1:
+                required.append(name)
+
+        return {
+            "type": "function",
+            "function": {
+                "name": self.function_name,
+                "description": self.description,
+                "parameters": {
+                    "type": "object",
+                    "properties": properties,
+                    "required": required
+                }
+            }
+        }
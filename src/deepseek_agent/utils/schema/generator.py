@@ -1,10 +1,55 @@
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, get_origin
+import functools
 import inspect
+import sys
 from .parameter_config import ParameterConfig
+from .compiled_schema import CompiledSchema
+
+# Claves JSON internadas: todos los schemas construidos comparten los
+# mismos objetos de clave, lo que reduce memoria y permite a dict usar
+# el fast path de comparación por identidad
+_K_TYPE = sys.intern("type")
+_K_DESCRIPTION = sys.intern("description")
+_K_FUNCTION = sys.intern("function")
+_K_NAME = sys.intern("name")
+_K_PARAMETERS = sys.intern("parameters")
+_K_PROPERTIES = sys.intern("properties")
+_K_REQUIRED = sys.intern("required")
+_K_ITEMS = sys.intern("items")
+
+# Introspección de firmas cacheada: inspect.signature es costoso y el
+# resultado no cambia para una misma función
+_get_signature = functools.lru_cache(maxsize=None)(inspect.signature)
+
+# Sentinela de "sin valor" hoisted para evitar lookups en el bucle
+_EMPTY = inspect.Parameter.empty
+
+# Mapeo tipo Python -> tipo JSON, construido una sola vez a nivel de módulo
+_TYPE_MAPPING = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object"
+}
+
+# Mapeo (atributo de ParameterConfig, clave JSON) para las validaciones
+# opcionales de una propiedad; se recorre en un solo bucle en lugar de
+# una cadena de ifs por cada campo
+_FIELD_MAP = (
+    ("enum", sys.intern("enum")),
+    ("minimum", sys.intern("minimum")),
+    ("maximum", sys.intern("maximum")),
+    ("min_length", sys.intern("minLength")),
+    ("max_length", sys.intern("maxLength")),
+    ("pattern", sys.intern("pattern")),
+    ("default", sys.intern("default")),
+)
 
 class SchemaGenerator:
     """Generador automático de schemas para function calling"""
-    
+
     @staticmethod
     def create_schema(
         function_name: str,
@@ -13,77 +58,144 @@ class SchemaGenerator:
     ) -> Dict[str, Any]:
         """
         Crea un schema completo para function calling
-        
+
+        Los schemas son datos inmutables, así que el resultado se memoiza:
+        llamadas repetidas con los mismos parámetros devuelven el mismo
+        objeto ya construido (no debe mutarse por el llamador).
+
         Args:
             function_name: Nombre de la función
             description: Descripción de qué hace la función
             parameters: Diccionario de configuraciones de parámetros
-        
+
         Returns:
             Schema completo en formato JSON
         """
-        schema = {
-            "type": "function",
-            "function": {
-                "name": function_name,
-                "description": description,
-                "parameters": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
+        try:
+            return SchemaGenerator._create_schema_cached(
+                function_name, description, tuple(parameters.items())
+            )
+        except TypeError:
+            # Alguna configuración no es hasheable (enum, items, etc.):
+            # construir sin pasar por la caché
+            return SchemaGenerator._build_schema(
+                function_name, description, parameters.items()
+            )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _create_schema_cached(
+        function_name: str,
+        description: str,
+        param_items: tuple
+    ) -> Dict[str, Any]:
+        """Versión memoizada: construye el schema una sola vez por firma"""
+        return SchemaGenerator._build_schema(function_name, description, param_items)
+
+    @staticmethod
+    def _build_schema(
+        function_name: str,
+        description: str,
+        param_items
+    ) -> Dict[str, Any]:
+        """Construye el schema completo a partir de pares (nombre, config)"""
+        # Procesar cada parámetro sobre locales: evita repetir el
+        # recorrido schema["function"]["parameters"][...] en cada vuelta
+        build_property = SchemaGenerator._build_property
+        properties = {}
+        required = []
+        for param_name, config in param_items:
+            properties[param_name] = build_property(config)
+            if config.required:
+                required.append(param_name)
+
+        return {
+            _K_TYPE: "function",
+            _K_FUNCTION: {
+                _K_NAME: function_name,
+                _K_DESCRIPTION: description,
+                _K_PARAMETERS: {
+                    _K_TYPE: "object",
+                    _K_PROPERTIES: properties,
+                    _K_REQUIRED: required
                 }
             }
         }
-        
-        # Procesar cada parámetro
-        for param_name, config in parameters.items():
+    
+    @staticmethod
+    def create_schema_compiled(
+        function_name: str,
+        description: str,
+        parameters: Dict[str, ParameterConfig]
+    ) -> CompiledSchema:
+        """
+        Crea la representación compacta (CompiledSchema) de un schema
+
+        Misma información que create_schema pero en tuplas paralelas;
+        el dict anidado se materializa después con to_dict() solo si
+        hace falta enviarlo al LLM.
+
+        Args:
+            function_name: Nombre de la función
+            description: Descripción de qué hace la función
+            parameters: Diccionario de configuraciones de parámetros
+
+        Returns:
+            CompiledSchema con los parámetros compilados
+        """
+        names = []
+        types = []
+        descriptions = []
+        extras = []
+        required_mask = 0
+
+        for i, (param_name, config) in enumerate(parameters.items()):
+            names.append(param_name)
+            types.append(config.param_type)
+            descriptions.append(config.description)
+
+            # Campos opcionales más allá de type/description
             prop = SchemaGenerator._build_property(config)
-            schema["function"]["parameters"]["properties"][param_name] = prop
-            
-            # Agregar a required si es necesario
+            del prop[_K_TYPE]
+            del prop[_K_DESCRIPTION]
+            extras.append(tuple(prop.items()) if prop else None)
+
             if config.required:
-                schema["function"]["parameters"]["required"].append(param_name)
-        
-        return schema
-    
+                required_mask |= 1 << i
+
+        return CompiledSchema(
+            function_name,
+            description,
+            tuple(names),
+            tuple(types),
+            tuple(descriptions),
+            tuple(extras),
+            required_mask
+        )
+
     @staticmethod
     def _build_property(config: ParameterConfig) -> Dict[str, Any]:
         """Construye una propiedad individual del schema"""
+        param_type = config.param_type
         prop = {
-            "type": config.param_type,
-            "description": config.description
+            _K_TYPE: param_type,
+            _K_DESCRIPTION: config.description
         }
-        
-        # Agregar validaciones según el tipo
-        if config.enum is not None:
-            prop["enum"] = config.enum
-        
-        if config.minimum is not None:
-            prop["minimum"] = config.minimum
-        
-        if config.maximum is not None:
-            prop["maximum"] = config.maximum
-        
-        if config.min_length is not None:
-            prop["minLength"] = config.min_length
-        
-        if config.max_length is not None:
-            prop["maxLength"] = config.max_length
-        
-        if config.pattern is not None:
-            prop["pattern"] = config.pattern
-        
-        if config.default is not None:
-            prop["default"] = config.default
-        
-        # Para arrays
-        if config.param_type == "array" and config.items is not None:
-            prop["items"] = config.items
-        
-        # Para objects
-        if config.param_type == "object" and config.properties is not None:
-            prop["properties"] = config.properties
-        
+
+        # Agregar validaciones opcionales recorriendo el mapeo una sola vez
+        for attr, key in _FIELD_MAP:
+            value = getattr(config, attr)
+            if value is not None:
+                prop[key] = value
+
+        # Campos específicos de arrays y objects
+        if param_type == "array":
+            if config.items is not None:
+                prop[_K_ITEMS] = config.items
+        elif param_type == "object":
+            if config.properties is not None:
+                prop[_K_PROPERTIES] = config.properties
+
         return prop
     
     @staticmethod
@@ -99,44 +211,36 @@ class SchemaGenerator:
         Returns:
             Schema generado automáticamente
         """
-        sig = inspect.signature(func)
+        sig = _get_signature(func)
         parameters = {}
-        
+
         for param_name, param in sig.parameters.items():
             # Determinar tipo basado en annotation
             param_type = SchemaGenerator._infer_type(param.annotation)
-            
+
             # Determinar si es requerido
-            required = param.default == inspect.Parameter.empty
-            
-            # Crear configuración
-            config = ParameterConfig(
+            required = param.default is _EMPTY
+
+            # Crear configuración (con default si existe; ParameterConfig
+            # es frozen, así que no se puede asignar después)
+            parameters[param_name] = ParameterConfig(
                 param_type=param_type,
                 description=param_descriptions.get(param_name, f"Parámetro {param_name}"),
-                required=required
+                required=required,
+                default=param.default if param.default is not _EMPTY else None
             )
-            
-            # Agregar default si existe
-            if param.default != inspect.Parameter.empty:
-                config.default = param.default
-            
-            parameters[param_name] = config
         
         return SchemaGenerator.create_schema(func.__name__, description, parameters)
     
     @staticmethod
     def _infer_type(annotation) -> str:
         """Infiere el tipo JSON desde type hints de Python"""
-        if annotation == inspect.Parameter.empty:
+        if annotation is _EMPTY:
             return "string"  # Default
-        
-        type_mapping = {
-            str: "string",
-            int: "integer", 
-            float: "number",
-            bool: "boolean",
-            list: "array",
-            dict: "object"
-        }
-        
-        return type_mapping.get(annotation, "string")
\ No newline at end of file
+
+        # Genéricos como List[str] o Dict[str, int] se mapean por su origen
+        origin = get_origin(annotation)
+        if origin is not None:
+            return _TYPE_MAPPING.get(origin, "string")
+
+        return _TYPE_MAPPING.get(annotation, "string")
\ No newline at end of file
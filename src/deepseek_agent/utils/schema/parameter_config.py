@@ -1,9 +1,14 @@
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Union
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParameterConfig:
-    """Configuración para un parámetro de función"""
+    """Configuración inmutable para un parámetro de función
+
+    frozen + slots reduce la memoria por instancia y hace las
+    instancias hasheables, lo que permite memoizar los schemas
+    generados a partir de ellas.
+    """
     param_type: str  # "string", "number", "integer", "boolean", "array", "object"
     description: str
     required: bool = False
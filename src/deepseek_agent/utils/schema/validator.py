@@ -1,74 +1,138 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable
+
+# Tipo JSON -> tipo(s) Python aceptados al validar argumentos
+_JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict
+}
+
+# Claves obligatorias de la definición de función (membresía O(1))
+_REQUIRED_KEYS = frozenset(("name", "description", "parameters"))
+
+# Caché de validadores compilados, por identidad del schema. Se guarda
+# también el schema para que su id no se reutilice: cada objeto schema
+# conserva su validador durante toda su vida. Mutar un schema in-place
+# NO invalida la entrada; compilar de nuevo tras mutar no está soportado
+_COMPILED_CACHE: Dict[int, tuple] = {}
 
 class SchemaValidator:
     """Valida schemas antes de usarlos"""
-    
+
     @staticmethod
-    def validate(schema: Dict[str, Any]) -> bool:
-        """Valida que un schema esté bien formado"""
-        try:
-            # Verificar estructura básica
-            if not isinstance(schema, dict):
-                return False
-            
-            if schema.get("type") != "function":
-                return False
-            
-            function_def = schema.get("function", {})
-            
-            required_keys = ["name", "description", "parameters"]
-            if not all(key in function_def for key in required_keys):
+    def compile(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compila un validador de argumentos especializado para un schema
+
+        Analiza los parámetros del schema una sola vez y devuelve un
+        closure que solo hace las comprobaciones que ese schema necesita
+        (requeridos presentes, nombres conocidos, tipos básicos). Útil
+        para validar los argumentos de cada tool call sin recorrer el
+        schema en cada invocación.
+
+        Args:
+            schema: Schema de función ya validado
+
+        Returns:
+            Callable que recibe el dict de argumentos y retorna bool
+        """
+        cached = _COMPILED_CACHE.get(id(schema))
+        if cached is not None:
+            return cached[1]
+
+        params = schema.get("function", {}).get("parameters", {}) if isinstance(schema, dict) else {}
+        properties = params.get("properties") or {}
+        required = frozenset(params.get("required") or ())
+        allowed = frozenset(properties)
+        expected_types = {
+            name: _JSON_TYPES[prop.get("type")]
+            for name, prop in properties.items()
+            if prop.get("type") in _JSON_TYPES
+        }
+
+        def validator(arguments: Dict[str, Any]) -> bool:
+            if not isinstance(arguments, dict):
                 return False
-            
-            # Validar parámetros
-            params = function_def.get("parameters", {})
-            if params.get("type") != "object":
+            if not required.issubset(arguments):
                 return False
-            
-            properties = params.get("properties", {})
-            required = params.get("required", [])
-            
-            # Verificar que todos los required estén en properties
-            for req_param in required:
-                if req_param not in properties:
+            for name, value in arguments.items():
+                if name not in allowed:
+                    return False
+                expected = expected_types.get(name)
+                if expected is None:
+                    continue
+                if not isinstance(value, expected):
+                    return False
+                # bool es subclase de int: no aceptarlo como numérico
+                if expected is not bool and isinstance(value, bool):
                     return False
-            
             return True
-            
-        except Exception:
-            return False
-    
+
+        _COMPILED_CACHE[id(schema)] = (schema, validator)
+        return validator
+
     @staticmethod
-    def get_validation_errors(schema: Dict[str, Any]) -> List[str]:
-        """Retorna lista de errores de validación"""
-        errors = []
-        
+    def _iter_errors(schema: Dict[str, Any]):
+        """
+        Genera los errores de validación de un schema, en orden
+
+        Único recorrido compartido por validate y get_validation_errors:
+        validate corta en el primer error y get_validation_errors
+        materializa la lista completa.
+        """
         if not isinstance(schema, dict):
-            errors.append("Schema debe ser un diccionario")
-            return errors
-        
+            yield "Schema debe ser un diccionario"
+            return
+
         if schema.get("type") != "function":
-            errors.append("Tipo debe ser 'function'")
-        
+            yield "Tipo debe ser 'function'"
+
         function_def = schema.get("function")
         if not function_def:
-            errors.append("Falta definición de 'function'")
-            return errors
-        
-        required_keys = ["name", "description", "parameters"]
-        for key in required_keys:
-            if key not in function_def:
-                errors.append(f"Falta campo requerido: function.{key}")
-        
-        params = function_def.get("parameters", {})
+            yield "Falta definición de 'function'"
+            return
+        if not isinstance(function_def, dict):
+            yield "'function' debe ser un diccionario"
+            return
+
+        for key in sorted(_REQUIRED_KEYS - function_def.keys()):
+            yield f"Falta campo requerido: function.{key}"
+
+        # Normalizar tipos inesperados en lugar de dejar que revienten:
+        # cada condición es una comprobación explícita que nunca lanza
+        params = function_def.get("parameters")
+        if not isinstance(params, dict):
+            params = {}
         if params.get("type") != "object":
-            errors.append("parameters.type debe ser 'object'")
-        
+            yield "parameters.type debe ser 'object'"
+
         properties = params.get("properties", {})
+        if not isinstance(properties, dict):
+            yield "parameters.properties debe ser un diccionario"
+            properties = {}
         required = params.get("required", [])
-        
+        if not isinstance(required, (list, tuple)):
+            yield "parameters.required debe ser una lista"
+            required = ()
+
+        # Verificar que todos los required estén en properties; solo las
+        # entradas string se pueden meter en un set (y ordenar) sin riesgo
         for req_param in required:
-            if req_param not in properties:
-                errors.append(f"Parámetro requerido '{req_param}' no está en properties")
-        
-        return errors
\ No newline at end of file
+            if not isinstance(req_param, str):
+                yield f"parameters.required solo admite strings: {req_param!r}"
+        required_names = {rp for rp in required if isinstance(rp, str)}
+        for req_param in sorted(required_names.difference(properties)):
+            yield f"Parámetro requerido '{req_param}' no está en properties"
+
+    @staticmethod
+    def validate(schema: Dict[str, Any]) -> bool:
+        """Valida que un schema esté bien formado"""
+        return next(SchemaValidator._iter_errors(schema), None) is None
+
+    @staticmethod
+    def get_validation_errors(schema: Dict[str, Any]) -> List[str]:
+        """Retorna lista de errores de validación"""
+        return list(SchemaValidator._iter_errors(schema))
\ No newline at end of file